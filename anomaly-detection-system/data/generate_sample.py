@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Generate sample network traffic data for the anomaly detection system."""
 import random
+import sys
 from datetime import datetime, timedelta
 
 random.seed(42)
@@ -17,47 +18,57 @@ dst_servers = [
 
 src_ips = ["192.168.1.10", "192.168.1.11", "192.168.1.12", "192.168.1.13", "192.168.1.14"]
 
-print("# Sample network traffic data for anomaly detection")
-print("# Format: timestamp src_ip src_port dst_ip dst_port protocol bytes duration")
+lines = [
+    "# Sample network traffic data for anomaly detection",
+    "# Format: timestamp src_ip src_port dst_ip dst_port protocol bytes duration",
+]
 
 base_time = datetime(2024, 1, 15, 10, 0, 0)
 
-# Generate 350 normal events
-for i in range(350):
-    ts = base_time + timedelta(seconds=i * 2 + random.uniform(-0.5, 0.5))
-    src_ip = random.choice(src_ips)
-    src_port = random.randint(49152, 51999)
-    dst_ip, dst_port, proto = random.choice(dst_servers)
+# Generate 350 normal events, drawing each column for all events up front
+n_events = 350
+choices, rand = random.choices, random.random
+src_col = choices(src_ips, k=n_events)
+src_port_col = choices(range(49152, 52000), k=n_events)
+dst_col = choices(dst_servers, k=n_events)
+dns_bytes_col = choices(range(50, 121), k=n_events)
+https_bytes_col = choices(range(500, 3001), k=n_events)
+jitter_col = [rand() - 0.5 for _ in range(n_events)]
+dur_col = [rand() for _ in range(n_events)]
+
+for i in range(n_events):
+    ts = base_time + timedelta(seconds=i * 2 + jitter_col[i])
+    dst_ip, dst_port, proto = dst_col[i]
 
     if proto == "UDP":  # DNS
-        bytes_val = random.randint(50, 120)
-        dur = round(random.uniform(0.005, 0.03), 4)
+        bytes_val = dns_bytes_col[i]
+        dur = round(0.005 + 0.025 * dur_col[i], 4)
     else:  # HTTPS
-        bytes_val = random.randint(500, 3000)
-        dur = round(random.uniform(0.02, 0.12), 4)
+        bytes_val = https_bytes_col[i]
+        dur = round(0.02 + 0.1 * dur_col[i], 4)
 
-    print(f"{ts.strftime('%Y-%m-%dT%H:%M:%S')} {src_ip} {src_port} {dst_ip} {dst_port} {proto} {bytes_val} {dur}")
+    lines.append(f"{ts.isoformat(timespec='seconds')} {src_col[i]} {src_port_col[i]} {dst_ip} {dst_port} {proto} {bytes_val} {dur}")
 
-print("#")
-print("# ===== ANOMALIES BELOW =====")
-print("#")
+lines += ["#", "# ===== ANOMALIES BELOW =====", "#"]
 
 # ANOMALY 1: Massive data exfiltration
 ts = base_time + timedelta(minutes=12)
-print(f"{ts.strftime('%Y-%m-%dT%H:%M:%S')} 192.168.1.10 49200 45.33.32.156 8443 TCP 9500000 120.50")
+lines.append(f"{ts.isoformat(timespec='seconds')} 192.168.1.10 49200 45.33.32.156 8443 TCP 9500000 120.50")
 
 # ANOMALY 2: Port scan (ICMP, unusual ports)
 ts = base_time + timedelta(minutes=12, seconds=5)
-print(f"{ts.strftime('%Y-%m-%dT%H:%M:%S')} 192.168.1.99 1 10.0.0.1 0 ICMP 28 0.001")
+lines.append(f"{ts.isoformat(timespec='seconds')} 192.168.1.99 1 10.0.0.1 0 ICMP 28 0.001")
 
 # ANOMALY 3: DNS exfiltration (huge DNS packet)
 ts = base_time + timedelta(minutes=12, seconds=10)
-print(f"{ts.strftime('%Y-%m-%dT%H:%M:%S')} 192.168.1.10 51250 8.8.8.8 53 UDP 4500000 30.00")
+lines.append(f"{ts.isoformat(timespec='seconds')} 192.168.1.10 51250 8.8.8.8 53 UDP 4500000 30.00")
 
 # ANOMALY 4: Connection at 3 AM to high port
 ts = datetime(2024, 1, 15, 3, 15, 0)
-print(f"{ts.strftime('%Y-%m-%dT%H:%M:%S')} 192.168.1.50 60000 198.51.100.1 31337 TCP 5000000 300.00")
+lines.append(f"{ts.isoformat(timespec='seconds')} 192.168.1.50 60000 198.51.100.1 31337 TCP 5000000 300.00")
 
 # ANOMALY 5: Zero-length rapid connection to SSH
 ts = base_time + timedelta(minutes=12, seconds=20)
-print(f"{ts.strftime('%Y-%m-%dT%H:%M:%S')} 192.168.1.10 49300 10.0.0.1 22 TCP 0 0.0001")
+lines.append(f"{ts.isoformat(timespec='seconds')} 192.168.1.10 49300 10.0.0.1 22 TCP 0 0.0001")
+
+sys.stdout.write("\n".join(lines) + "\n")
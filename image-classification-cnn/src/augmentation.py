@@ -1,10 +1,18 @@
 """
 Data augmentation utilities for image classification
+
+Generators are cached and shared between callers. The rescale-only
+generators are effectively immutable, but calling ``.fit()`` on a shared
+generator changes its statistics for every other user.
 """
 
+from functools import lru_cache
+
+from tensorflow.keras import layers, Sequential
 from tensorflow.keras.preprocessing.image import ImageDataGenerator
 
 
+@lru_cache(maxsize=None)
 def get_train_augmentation():
     """
     Create data augmentation pipeline for training data
@@ -26,6 +34,7 @@ def get_train_augmentation():
     )
 
 
+@lru_cache(maxsize=None)
 def get_val_augmentation():
     """
     Create data augmentation pipeline for validation data (minimal augmentation)
@@ -36,6 +45,7 @@ def get_val_augmentation():
     return ImageDataGenerator(rescale=1./255)
 
 
+@lru_cache(maxsize=None)
 def get_test_augmentation():
     """
     Create data augmentation pipeline for test data (only normalization)
@@ -74,6 +84,18 @@ def create_custom_augmentation(
     Returns:
         ImageDataGenerator with custom parameters
     """
+    # Range arguments may be lists, which lru_cache cannot hash
+    args = (rotation_range, width_shift_range, height_shift_range, zoom_range,
+            horizontal_flip, vertical_flip, shear_range, brightness_range, fill_mode)
+    return _cached_custom_augmentation(
+        *(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+    )
+
+
+@lru_cache(maxsize=None)
+def _cached_custom_augmentation(rotation_range, width_shift_range, height_shift_range,
+                                zoom_range, horizontal_flip, vertical_flip, shear_range,
+                                brightness_range, fill_mode):
     return ImageDataGenerator(
         rescale=1./255,
         rotation_range=rotation_range,
@@ -83,6 +105,41 @@ def create_custom_augmentation(
         vertical_flip=vertical_flip,
         zoom_range=zoom_range,
         shear_range=shear_range,
-        brightness_range=brightness_range,
+        brightness_range=list(brightness_range) if brightness_range else None,
         fill_mode=fill_mode
     )
+
+
+def get_train_augmentation_layers():
+    """
+    Create graph-based augmentation for training data, for use in tf.data pipelines
+
+    Approximates get_train_augmentation with two differences: shear is
+    dropped, since Keras has no shear preprocessing layer, and brightness
+    is shifted additively by up to +/-0.2 (on the [0, 1] scale) rather than
+    scaled by a factor in [0.8, 1.2]. Runs as TensorFlow ops, so it can be
+    mapped in parallel and placed on the GPU.
+    
+    Returns:
+        Sequential model of preprocessing layers (call with training=True)
+    """
+    # Pinned to float32: these run on the CPU inside tf.data, where the
+    # mixed_float16 policy set by model.py would only slow them down
+    return Sequential([
+        layers.Rescaling(1./255, dtype='float32'),
+        layers.RandomFlip('horizontal', dtype='float32'),
+        layers.RandomRotation(20 / 360, fill_mode='nearest', dtype='float32'),
+        layers.RandomTranslation(0.2, 0.2, fill_mode='nearest', dtype='float32'),
+        layers.RandomZoom(0.2, fill_mode='nearest', dtype='float32'),
+        layers.RandomBrightness(0.2, value_range=(0, 1), dtype='float32'),
+    ], name='train_augmentation')
+
+
+def get_eval_preprocessing_layers():
+    """
+    Create graph-based preprocessing for validation/test data (only normalization)
+    
+    Returns:
+        Sequential model with only rescaling
+    """
+    return Sequential([layers.Rescaling(1./255, dtype='float32')], name='eval_preprocessing')
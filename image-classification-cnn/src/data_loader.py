@@ -4,8 +4,15 @@ Data loading and preprocessing utilities for image classification
 
 import os
 import numpy as np
+import tensorflow as tf
 from tensorflow.keras.preprocessing import image
-from augmentation import get_train_augmentation, get_val_augmentation, get_test_augmentation
+from augmentation import (
+    get_train_augmentation,
+    get_val_augmentation,
+    get_test_augmentation,
+    get_train_augmentation_layers,
+    get_eval_preprocessing_layers,
+)
 
 
 def load_images_from_directory(directory, target_size=(224, 224)):
@@ -69,6 +76,66 @@ def create_data_generators(train_dir, val_dir=None, batch_size=32, target_size=(
     return train_generator, val_generator
 
 
+def create_datasets(train_dir, val_dir=None, batch_size=32, target_size=(224, 224)):
+    """
+    Create tf.data pipelines for training and validation
+    
+    Decoded images are cached after the first epoch; augmentation runs as
+    parallel graph ops and batches are prefetched so input preparation
+    overlaps with training.
+    
+    Args:
+        train_dir: Path to training data directory
+        val_dir: Path to validation data directory
+        batch_size: Batch size for datasets
+        target_size: Target image size
+        
+    Returns:
+        Tuple of (train_dataset, val_dataset)
+    """
+    autotune = tf.data.AUTOTUNE
+    augment = get_train_augmentation_layers()
+    preprocess = get_eval_preprocessing_layers()
+    
+    # Load unbatched so the cached images can still be reshuffled every epoch
+    train_dataset = tf.keras.utils.image_dataset_from_directory(
+        train_dir,
+        image_size=target_size,
+        batch_size=None,
+        label_mode='categorical',
+        interpolation='nearest',
+        shuffle=True
+    )
+    train_dataset = (
+        train_dataset
+        .cache()
+        .shuffle(1000)
+        .batch(batch_size)
+        .map(lambda x, y: (augment(x, training=True), y), num_parallel_calls=autotune)
+        .prefetch(autotune)
+    )
+    
+    if val_dir:
+        val_dataset = tf.keras.utils.image_dataset_from_directory(
+            val_dir,
+            image_size=target_size,
+            batch_size=batch_size,
+            label_mode='categorical',
+            interpolation='nearest',
+            shuffle=False
+        )
+        val_dataset = (
+            val_dataset
+            .map(lambda x, y: (preprocess(x), y), num_parallel_calls=autotune)
+            .cache()
+            .prefetch(autotune)
+        )
+    else:
+        val_dataset = None
+    
+    return train_dataset, val_dataset
+
+
 def get_class_names(directory):
     """
     Get class names from directory structure
@@ -99,3 +166,43 @@ def prepare_single_image(image_path, target_size=(224, 224)):
     img_array = np.expand_dims(img_array, axis=0)  # Add batch dimension
     
     return img_array
+
+
+def load_and_preprocess_image(image_path, target_size=(224, 224)):
+    """
+    Load and normalize an image with TensorFlow ops, for use in tf.data pipelines
+    
+    Matches prepare_single_image (nearest-neighbour resize, [0, 1] scaling)
+    without the batch dimension.
+    
+    Args:
+        image_path: Path to image file (string tensor)
+        target_size: Target image size
+        
+    Returns:
+        Float32 image tensor of shape (height, width, 3)
+    """
+    img = tf.io.decode_image(tf.io.read_file(image_path), channels=3, expand_animations=False)
+    img = tf.image.resize(img, target_size, method='nearest')
+    return tf.cast(img, tf.float32) / 255.0
+
+
+def create_prediction_dataset(image_paths, batch_size=32, target_size=(224, 224)):
+    """
+    Create a batched tf.data pipeline over image files for inference
+    
+    Args:
+        image_paths: List of image file paths
+        batch_size: Batch size
+        target_size: Target image size
+        
+    Returns:
+        tf.data.Dataset yielding image batches in input order
+    """
+    return (
+        tf.data.Dataset.from_tensor_slices(list(image_paths))
+        .map(lambda path: load_and_preprocess_image(path, target_size),
+             num_parallel_calls=tf.data.AUTOTUNE)
+        .batch(batch_size)
+        .prefetch(tf.data.AUTOTUNE)
+    )
@@ -13,13 +13,20 @@ for split in [train_dir, val_dir]:
     for cls in classes:
         os.makedirs(os.path.join(split, cls), exist_ok=True)
 
+rng = np.random.default_rng(0)
+
+# Scratch buffer reused for every image; each image is saved before the next is made
+pixels = np.empty((224, 224, 3), dtype=np.uint8)
+
 # Helper to create a random image with a base color
 def make_image(base_color):
-    img = np.zeros((224, 224, 3), dtype=np.uint8)
-    noise = np.random.randint(0, 50, (224, 224, 3), dtype=np.uint8)
-    img[:] = base_color
-    img = np.clip(img + noise, 0, 255)
-    return Image.fromarray(img)
+    noise = rng.integers(0, 50, size=pixels.shape, dtype=np.uint8)
+    # Base channels are <= 200 and noise < 50, so the uint8 add never overflows
+    np.add(np.asarray(base_color, dtype=np.uint8), noise, out=pixels)
+    return Image.fromarray(pixels)
+
+# Noise barely compresses, so skip the expensive DEFLATE levels
+PNG_OPTIONS = {"format": "PNG", "compress_level": 1, "optimize": False}
 
 # Generate images
 counts = {"train": {}, "val": {}}
@@ -33,14 +40,14 @@ for cls in classes:
     cls_train = os.path.join(train_dir, cls)
     for i in range(10):
         img = make_image(base_colors[cls])
-        img.save(os.path.join(cls_train, f"{cls}_train_{i}.png"))
+        img.save(os.path.join(cls_train, f"{cls}_train_{i}.png"), **PNG_OPTIONS)
     counts["train"][cls] = len([f for f in os.listdir(cls_train) if f.lower().endswith(('.png','.jpg','.jpeg'))])
 
     # 4 validation images per class
     cls_val = os.path.join(val_dir, cls)
     for i in range(4):
         img = make_image(base_colors[cls])
-        img.save(os.path.join(cls_val, f"{cls}_val_{i}.png"))
+        img.save(os.path.join(cls_val, f"{cls}_val_{i}.png"), **PNG_OPTIONS)
     counts["val"][cls] = len([f for f in os.listdir(cls_val) if f.lower().endswith(('.png','.jpg','.jpeg'))])
 
 print("Dataset created at:", root)
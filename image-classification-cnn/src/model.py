@@ -8,6 +8,12 @@ from tensorflow.keras import layers
 from tensorflow.keras.applications import ResNet50, VGG16, MobileNetV2, EfficientNetB0
 from tensorflow.keras.layers import Dense, GlobalAveragePooling2D, Dropout
 from tensorflow.keras.models import Sequential, Model
+from tensorflow.keras import mixed_precision
+
+# Compute in float16 on GPUs (tensor cores); CPUs gain nothing from it.
+# compile() wraps the optimizer in a LossScaleOptimizer under this policy.
+if tf.config.list_physical_devices('GPU'):
+    mixed_precision.set_global_policy('mixed_float16')
 
 
 def create_simple_cnn(input_shape=(224, 224, 3), num_classes=10):
@@ -45,7 +51,8 @@ def create_simple_cnn(input_shape=(224, 224, 3), num_classes=10):
         layers.GlobalAveragePooling2D(),
         layers.Dense(512, activation='relu'),
         layers.Dropout(0.5),
-        layers.Dense(num_classes, activation='softmax')
+        # Keep the softmax in float32 for a numerically stable loss
+        layers.Dense(num_classes, activation='softmax', dtype='float32')
     ])
     
     model.compile(
@@ -105,7 +112,7 @@ def create_transfer_learning_model(model_name='resnet50', num_classes=10,
     x = Dropout(0.3)(x)
     x = Dense(256, activation='relu')(x)
     x = Dropout(0.3)(x)
-    outputs = Dense(num_classes, activation='softmax')(x)
+    outputs = Dense(num_classes, activation='softmax', dtype='float32')(x)
     
     model = Model(inputs, outputs)
     
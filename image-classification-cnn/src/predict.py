@@ -3,12 +3,48 @@ Prediction script for image classification
 """
 
 import argparse
+import os
+from functools import lru_cache
 import numpy as np
 from tensorflow import keras
-from data_loader import prepare_single_image, get_class_names
+from data_loader import prepare_single_image, get_class_names, create_prediction_dataset
 import matplotlib.pyplot as plt
 
 
+@lru_cache(maxsize=4)
+def load_model(model_path):
+    """
+    Load a trained model, reusing it on later calls with the same path
+    
+    Args:
+        model_path: Path to trained model
+        
+    Returns:
+        Keras model
+    """
+    model = keras.models.load_model(model_path)
+    print(f"Model loaded from {model_path}")
+    return model
+
+
+def top_k_indices(scores, k):
+    """
+    Get indices of the k highest scores, best first
+    
+    Args:
+        scores: 1-D array of class scores
+        k: Number of indices to return
+        
+    Returns:
+        Array of at most k indices sorted by descending score
+    """
+    if len(scores) <= k:
+        return np.argsort(scores)[::-1]
+    # Partition in O(N), then sort only the k winners
+    top = np.argpartition(scores, -k)[-k:]
+    return top[np.argsort(scores[top])[::-1]]
+
+
 def predict_image(image_path, model_path, class_names=None):
     """
     Make prediction on a single image
@@ -23,14 +59,13 @@ def predict_image(image_path, model_path, class_names=None):
     """
     
     # Load model
-    model = keras.models.load_model(model_path)
-    print(f"Model loaded from {model_path}")
+    model = load_model(model_path)
     
     # Prepare image
     img_array = prepare_single_image(image_path)
     
     # Make prediction
-    predictions = model.predict(img_array)
+    predictions = model.predict(img_array, verbose=0)
     predicted_class_idx = np.argmax(predictions[0])
     confidence = predictions[0][predicted_class_idx]
     
@@ -45,7 +80,7 @@ def predict_image(image_path, model_path, class_names=None):
     
     # Print top 5 predictions
     print("\nTop 5 Predictions:")
-    top_5_idx = np.argsort(predictions[0])[-5:][::-1]
+    top_5_idx = top_k_indices(predictions[0], 5)
     for idx, class_idx in enumerate(top_5_idx, 1):
         class_name = class_names[class_idx] if class_names else f"Class {class_idx}"
         conf = predictions[0][class_idx]
@@ -54,6 +89,39 @@ def predict_image(image_path, model_path, class_names=None):
     return predicted_class, confidence, predictions[0]
 
 
+def predict_images(image_paths, model_path, class_names=None, batch_size=32):
+    """
+    Make predictions on many images with batched model calls
+    
+    Args:
+        image_paths: List of image file paths
+        model_path: Path to trained model
+        class_names: List of class names
+        batch_size: Number of images per model call
+        
+    Returns:
+        List of (predicted class, confidence) tuples in input order
+    """
+    if not image_paths:
+        raise ValueError("No images to predict: image_paths is empty")
+    
+    model = load_model(model_path)
+    
+    # Decoding and resizing overlap with inference through the tf.data pipeline
+    dataset = create_prediction_dataset(image_paths, batch_size=batch_size)
+    predictions = model.predict(dataset, verbose=0)
+    predicted_idx = np.argmax(predictions, axis=1)
+    confidences = predictions[np.arange(len(predictions)), predicted_idx]
+    
+    results = []
+    for image_path, class_idx, confidence in zip(image_paths, predicted_idx, confidences):
+        predicted_class = class_names[class_idx] if class_names else f"Class {class_idx}"
+        print(f"{image_path}: {predicted_class} ({confidence:.2%})")
+        results.append((predicted_class, confidence))
+    
+    return results
+
+
 def visualize_prediction(image_path, model_path, class_names=None):
     """
     Visualize prediction on image
@@ -95,22 +163,37 @@ def visualize_prediction(image_path, model_path, class_names=None):
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Make predictions using trained model')
-    parser.add_argument('--image', type=str, required=True,
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--image', type=str,
                         help='Path to image file')
+    source.add_argument('--image-dir', type=str,
+                        help='Path to directory of images to predict in batches')
     parser.add_argument('--model', type=str, required=True,
                         help='Path to trained model file')
     parser.add_argument('--classes-dir', type=str, default=None,
                         help='Path to directory with class folders for class names')
     parser.add_argument('--visualize', action='store_true',
                         help='Visualize prediction')
+    parser.add_argument('--batch-size', type=int, default=32,
+                        help='Batch size for --image-dir predictions')
     
     args = parser.parse_args()
+    if args.image_dir and args.visualize:
+        parser.error('--visualize only supports a single --image')
     
     class_names = None
     if args.classes_dir:
         class_names = get_class_names(args.classes_dir)
     
-    if args.visualize:
+    if args.image_dir:
+        image_paths = sorted(
+            os.path.join(args.image_dir, f) for f in os.listdir(args.image_dir)
+            if f.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.gif'))
+        )
+        if not image_paths:
+            parser.error(f'No image files found in {args.image_dir}')
+        predict_images(image_paths, args.model, class_names, batch_size=args.batch_size)
+    elif args.visualize:
         visualize_prediction(args.image, args.model, class_names)
     else:
         predict_image(args.image, args.model, class_names)
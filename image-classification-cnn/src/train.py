@@ -6,7 +6,7 @@ import os
 import argparse
 import numpy as np
 from model import create_simple_cnn, create_transfer_learning_model, get_callbacks
-from data_loader import create_data_generators, get_class_names
+from data_loader import create_datasets, get_class_names
 import matplotlib.pyplot as plt
 
 
@@ -26,14 +26,14 @@ def train_model(train_dir, val_dir=None, model_type='transfer', transfer_model='
     """
     
     print(f"Loading data from {train_dir}...")
-    train_generator, val_generator = create_data_generators(
+    train_dataset, val_dataset = create_datasets(
         train_dir,
         val_dir=val_dir,
         batch_size=batch_size
     )
     
-    num_classes = len(get_class_names(train_dir))
     class_names = get_class_names(train_dir)
+    num_classes = len(class_names)
     print(f"Number of classes: {num_classes}")
     print(f"Class names: {class_names}")
 
@@ -58,21 +58,22 @@ def train_model(train_dir, val_dir=None, model_type='transfer', transfer_model='
     print("\nModel Summary:")
     model.summary()
     
-    callbacks = get_callbacks(model_name=f"{model_type}_{transfer_model if model_type == 'transfer' else 'cnn'}")
+    model_name = transfer_model if model_type == 'transfer' else 'cnn'
+    callbacks = get_callbacks(model_name=f"{model_type}_{model_name}")
     
     print(f"\nTraining for {epochs} epochs...")
     history = model.fit(
-        train_generator,
-        validation_data=val_generator,
+        train_dataset,
+        validation_data=val_dataset,
         epochs=epochs,
         callbacks=callbacks
     )
     
-    save_path = f"models/{model_type}_{transfer_model if model_type == 'transfer' else 'cnn'}_final.h5"
+    save_path = f"models/{model_type}_{model_name}_final.h5"
     model.save(save_path)
     print(f"\nModel saved to {save_path}")
     
-    plot_training_history(history, model_type, transfer_model if model_type == 'transfer' else 'cnn')
+    plot_training_history(history, model_type, model_name)
     
     return model, history
 
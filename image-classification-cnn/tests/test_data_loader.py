@@ -0,0 +1,28 @@
+"""
+Smoke checks for the tf.data loading paths
+"""
+
+import os
+import sys
+
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from data_loader import create_prediction_dataset  # noqa: E402
+
+
+def test_create_prediction_dataset_yields_float_batches():
+    # PNGs written by src/generate_dummy_dataset.py
+    class_dir = os.path.join(ROOT, 'data', 'train', 'classA')
+    image_paths = [os.path.join(class_dir, f"classA_train_{i}.png") for i in range(3)]
+    
+    batches = list(create_prediction_dataset(image_paths, batch_size=2))
+    
+    assert [batch.shape[0] for batch in batches] == [2, 1]
+    assert batches[0].shape[1:] == (224, 224, 3)
+    assert batches[0].dtype == tf.float32
+    assert float(tf.reduce_max(batches[0])) <= 1.0
@@ -25,6 +25,18 @@ class Settings(BaseSettings):
         default=512, description="Maximum sequence length for truncation"
     )
     batch_size: int = Field(default=8, description="Batch size for inference")
+    prediction_cache_size: int = Field(
+        default=10_000,
+        description="Single-text predictions kept in an LRU cache; 0 disables it",
+    )
+    onnx_quantize: bool = Field(
+        default=False,
+        description="Serve an int8-quantized ONNX Runtime export instead of PyTorch",
+    )
+    onnx_cache_dir: str = Field(
+        default="./onnx-cache",
+        description="Directory holding the exported and quantized ONNX models",
+    )
 
     class Config:
         env_prefix = "SA_"
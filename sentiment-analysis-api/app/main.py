@@ -1,6 +1,8 @@
+from contextlib import asynccontextmanager
 from functools import lru_cache
 
 from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.schemas import (
     BatchSentimentRequest,
@@ -10,14 +12,30 @@ from app.schemas import (
 )
 from app.service.sentiment import SentimentService
 
-app = FastAPI(title="Sentiment Analysis API", version="0.1.0")
-
 
 @lru_cache()
 def get_service() -> SentimentService:
     return SentimentService()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load and exercise the model before serving so no request pays for it.
+    service = app.dependency_overrides.get(get_service, get_service)()
+    service.analyze_batch(["warmup", "warmup"])
+    # Single texts take a separate direct-model path; warm that up too.
+    service.analyze_text("warmup")
+    yield
+
+
+app = FastAPI(
+    title="Sentiment Analysis API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+
 @app.get("/health", response_model=HealthResponse)
 def health(service: SentimentService = Depends(get_service)) -> HealthResponse:
     return HealthResponse(status="ok", model=service.model_name)
@@ -26,10 +44,10 @@ def health(service: SentimentService = Depends(get_service)) -> HealthResponse:
 @app.post("/sentiment", response_model=SentimentResult)
 def analyze_sentiment(
     payload: SentimentRequest, service: SentimentService = Depends(get_service)
-) -> SentimentResult:
+) -> dict:
+    # response_model validates the plain dict once; no need to build the model here.
     try:
-        result = service.analyze_text(payload.text, language=payload.language)
-        return SentimentResult(**result)
+        return service.analyze_text(payload.text, language=payload.language)
     except Exception as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -37,9 +55,8 @@ def analyze_sentiment(
 @app.post("/sentiment/batch", response_model=list[SentimentResult])
 def analyze_batch(
     payload: BatchSentimentRequest, service: SentimentService = Depends(get_service)
-) -> list[SentimentResult]:
+) -> list[dict]:
     try:
-        results = service.analyze_batch(payload.texts, language=payload.language)
-        return [SentimentResult(**item) for item in results]
+        return service.analyze_batch(payload.texts, language=payload.language)
     except Exception as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -1,8 +1,70 @@
-from typing import List, Optional
+import logging
+import os
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+import torch
 from transformers import AutoTokenizer, pipeline
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def load_quantized_onnx_model(settings: Settings):
+    """Export the model to ONNX, quantize weights to int8 and load it with ONNX Runtime.
+
+    The export is cached under ``settings.onnx_cache_dir`` so only the first
+    start pays for the conversion. Requires ``optimum[onnxruntime]``.
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+
+    export_dir = os.path.join(
+        settings.onnx_cache_dir,
+        settings.model_name.replace("/", "--"),
+        settings.model_revision or "default",
+    )
+    quantized_file = "model_quantized.onnx"
+    quantized_path = os.path.join(export_dir, quantized_file)
+    if not os.path.exists(quantized_path):
+        model = ORTModelForSequenceClassification.from_pretrained(
+            settings.model_name, revision=settings.model_revision, export=True
+        )
+        model.save_pretrained(export_dir)
+        quantize_dynamic(
+            os.path.join(export_dir, "model.onnx"),
+            quantized_path,
+            weight_type=QuantType.QInt8,
+        )
+    return ORTModelForSequenceClassification.from_pretrained(
+        export_dir, file_name=quantized_file, provider="CPUExecutionProvider"
+    )
+
+
+def optimize_torch_model(model, tokenizer, device: int):
+    """Swap in fused attention kernels and, on GPU, compile the forward pass.
+
+    Each step is best effort: installs without ``optimum`` or with an
+    unsupported architecture keep the stock model.
+    """
+    try:
+        from optimum.bettertransformer import BetterTransformer
+
+        model = BetterTransformer.transform(model)
+    except Exception as exc:  # pragma: no cover - optional extra / unsupported model
+        logger.info("BetterTransformer not applied, using stock attention: %s", exc)
+    if device >= 0:
+        try:
+            compiled = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+            # torch.compile is lazy; run one forward so failures surface here.
+            inputs = tokenizer("warmup", return_tensors="pt").to(model.device)
+            with torch.inference_mode():
+                compiled(**inputs)
+            model = compiled
+        except Exception as exc:  # pragma: no cover - compile unsupported
+            logger.warning("torch.compile failed, using eager model: %s", exc)
+    return model
 
 
 class SentimentService:
@@ -15,21 +77,63 @@ class SentimentService:
         tokenizer = AutoTokenizer.from_pretrained(
             self.model_name, revision=settings.model_revision
         )
-        self.pipeline = pipeline(
-            task=settings.pipeline_task,
-            model=self.model_name,
-            tokenizer=tokenizer,
-            revision=settings.model_revision,
-            device=settings.device,
-            truncation=True,
-        )
+        if settings.onnx_quantize:
+            # ONNX Runtime models plug into the same pipeline API (CPU only).
+            self.pipeline = pipeline(
+                task=settings.pipeline_task,
+                model=load_quantized_onnx_model(settings),
+                tokenizer=tokenizer,
+                truncation=True,
+            )
+        else:
+            self.pipeline = pipeline(
+                task=settings.pipeline_task,
+                model=self.model_name,
+                tokenizer=tokenizer,
+                revision=settings.model_revision,
+                device=settings.device,
+                truncation=True,
+            )
+            self.pipeline.model = optimize_torch_model(
+                self.pipeline.model, tokenizer, settings.device
+            )
+        self.tokenizer = tokenizer
+        self.model = self.pipeline.model
+        self.device = self.pipeline.device
+        self.id2label = self.model.config.id2label
+        # Same activation choice the text-classification pipeline makes.
+        config = self.model.config
+        if (
+            config.problem_type == "multi_label_classification"
+            or config.num_labels == 1
+        ):
+            self._activation = torch.sigmoid
+        else:
+            self._activation = lambda logits: logits.softmax(-1)
         self.max_length = settings.max_length
         self.batch_size = settings.batch_size
+        # Resolve every label the model can emit once, so results only need a lookup.
+        self._label_map = {
+            raw.lower(): self._normalize_label(raw)
+            for raw in self.id2label.values()
+        }
+        # Per-instance cache, so it is dropped together with the loaded model.
+        self._predict_cached = lru_cache(maxsize=settings.prediction_cache_size)(
+            self._predict
+        )
 
     def _normalize(self, label: str) -> str:
+        cleaned = label.lower()
+        normalized = self._label_map.get(cleaned)
+        if normalized is None:
+            normalized = self._label_map[cleaned] = self._normalize_label(cleaned)
+        return normalized
+
+    @staticmethod
+    def _normalize_label(label: str) -> str:
         # Common multilingual models return either sentiment words or star ratings.
         cleaned = label.lower()
-        if cleaned.startswith("star") or cleaned.startswith("label_"):
+        if "star" in cleaned or cleaned.startswith("label_"):
             # nlptown/bert-base-multilingual-uncased-sentiment returns 1-5 stars.
             try:
                 stars = int("".join(ch for ch in cleaned if ch.isdigit()))
@@ -42,16 +146,26 @@ class SentimentService:
                 return cleaned
         return cleaned
 
-    def analyze_text(self, text: str, language: Optional[str] = None) -> dict:
-        result = self.pipeline(
+    def _predict(self, text: str) -> Tuple[str, float]:
+        # Single texts skip the pipeline machinery and call the model directly.
+        inputs = self.tokenizer(
             text,
             truncation=True,
             max_length=self.max_length,
-            batch_size=self.batch_size,
-        )[0]
+            return_tensors="pt",
+        ).to(self.device)
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits
+        probs = self._activation(logits[0].float())
+        idx = int(probs.argmax())
+        return self._normalize(self.id2label[idx]), float(probs[idx])
+
+    def analyze_text(self, text: str, language: Optional[str] = None) -> dict:
+        # The language hint does not affect the prediction, so only text is cached.
+        label, score = self._predict_cached(text)
         return {
-            "label": self._normalize(result["label"]),
-            "score": float(result["score"]),
+            "label": label,
+            "score": score,
             "model": self.model_name,
             "language": language,
         }
@@ -59,12 +173,25 @@ class SentimentService:
     def analyze_batch(
         self, texts: List[str], language: Optional[str] = None
     ) -> List[dict]:
-        outputs = self.pipeline(
+        # Run similar-length texts together so each batch pads to a short maximum.
+        lengths = self.tokenizer(
             texts,
+            add_special_tokens=False,
+            truncation=True,
+            max_length=self.max_length,
+            return_length=True,
+        )["length"]
+        order = sorted(range(len(texts)), key=lengths.__getitem__)
+        sorted_outputs = self.pipeline(
+            [texts[i] for i in order],
             truncation=True,
+            padding=True,
             max_length=self.max_length,
             batch_size=self.batch_size,
         )
+        outputs: List[dict] = [{}] * len(texts)
+        for position, item in zip(order, sorted_outputs):
+            outputs[position] = item
         return [
             {
                 "label": self._normalize(item["label"]),
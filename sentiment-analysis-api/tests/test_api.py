@@ -45,3 +45,14 @@ def test_sentiment_batch():
     assert len(body) == 2
     assert all(item["label"] == "positive" for item in body)
     app.dependency_overrides = {}
+
+
+def test_startup_warms_service():
+    service = FakeSentimentService()
+    calls = []
+    service.analyze_batch = lambda texts, language=None: calls.append(texts)
+    service.analyze_text = lambda text, language=None: calls.append(text)
+    app.dependency_overrides[get_service] = lambda: service
+    with TestClient(app):
+        assert calls == [["warmup", "warmup"], "warmup"]
+    app.dependency_overrides = {}
@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+
+import torch
+
+from app.service import sentiment
+from app.service.sentiment import SentimentService
+
+
+class FakeEncoding(dict):
+    def to(self, device):
+        return self
+
+
+class FakeTokenizer:
+    def __call__(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return FakeEncoding()
+        return {"length": [len(t.split()) for t in texts]}
+
+
+class FakeModel:
+    def __init__(self, id2label, problem_type=None):
+        self.calls = 0
+        self.config = SimpleNamespace(
+            id2label=id2label, num_labels=len(id2label), problem_type=problem_type
+        )
+
+    def __call__(self, **inputs):
+        self.calls += 1
+        return SimpleNamespace(logits=torch.tensor([[0.0, 2.0]]))
+
+
+class FakePipeline:
+    def __init__(self, model):
+        self.model = model
+        self.device = "cpu"
+        self.calls = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        # Echo each text back as its label so the output order is visible.
+        return [{"label": text, "score": 0.5} for text in texts]
+
+
+def make_service(monkeypatch, id2label=None, **settings_overrides):
+    """Build a SentimentService through its real __init__ with stubbed model loading."""
+    settings = SimpleNamespace(
+        model_name="fake-model",
+        model_revision=None,
+        device=-1,
+        pipeline_task="text-classification",
+        max_length=512,
+        batch_size=2,
+        prediction_cache_size=16,
+        onnx_quantize=False,
+        onnx_cache_dir="",
+    )
+    for key, value in settings_overrides.items():
+        setattr(settings, key, value)
+    model = FakeModel(id2label or {0: "negative", 1: "positive"})
+    monkeypatch.setattr(sentiment, "get_settings", lambda: settings)
+    monkeypatch.setattr(
+        sentiment.AutoTokenizer, "from_pretrained", lambda *args, **kwargs: FakeTokenizer()
+    )
+    monkeypatch.setattr(sentiment, "pipeline", lambda **kwargs: FakePipeline(model))
+    monkeypatch.setattr(
+        sentiment, "optimize_torch_model", lambda model, tokenizer, device: model
+    )
+    return SentimentService()
+
+
+def test_analyze_batch_keeps_request_order(monkeypatch):
+    service = make_service(monkeypatch)
+    texts = ["a very long text with many words", "short", "medium length text"]
+
+    results = service.analyze_batch(texts, language="en")
+
+    assert service.pipeline.calls == [
+        ["short", "medium length text", "a very long text with many words"]
+    ]
+    assert [item["label"] for item in results] == texts
+    assert all(item["language"] == "en" for item in results)
+
+
+def test_analyze_text_caches_repeated_predictions(monkeypatch):
+    service = make_service(monkeypatch)
+
+    first = service.analyze_text("great product", language="en")
+    second = service.analyze_text("great product", language="es")
+
+    assert service.model.calls == 1
+    assert first["label"] == second["label"] == "positive"
+    # Multi-class model: softmax over logits [0, 2]
+    assert abs(first["score"] - 0.8808) < 1e-3
+    assert first["score"] == second["score"]
+    assert (first["language"], second["language"]) == ("en", "es")
+
+    service.analyze_text("another text")
+    assert service.model.calls == 2
+
+
+def test_prediction_cache_size_zero_disables_caching(monkeypatch):
+    service = make_service(monkeypatch, prediction_cache_size=0)
+
+    service.analyze_text("great product")
+    service.analyze_text("great product")
+
+    assert service.model.calls == 2
+
+
+def test_label_map_normalizes_star_ratings(monkeypatch):
+    id2label = {0: "1 star", 1: "2 stars", 2: "3 stars", 3: "4 stars", 4: "5 stars"}
+    service = make_service(monkeypatch, id2label=id2label)
+
+    assert service._label_map == {
+        "1 star": "negative",
+        "2 stars": "negative",
+        "3 stars": "neutral",
+        "4 stars": "positive",
+        "5 stars": "positive",
+    }
+    assert service._normalize("5 Stars") == "positive"
+
+
+def test_unknown_labels_are_normalized_and_added_to_map(monkeypatch):
+    service = make_service(monkeypatch, id2label={0: "LABEL_0", 1: "LABEL_4"})
+
+    assert service._label_map == {"label_0": "negative", "label_4": "positive"}
+    assert service._normalize("LABEL_3") == "neutral"
+    assert service._normalize("Mixed") == "mixed"
+    assert service._label_map["label_3"] == "neutral"
+    assert service._label_map["mixed"] == "mixed"